@@ -0,0 +1,93 @@
+"""Full-table export: plain tuples vs typed records vs streaming iterators.
+
+    python benchmarks/bench_export.py [students] [attendance]
+
+Builds a throwaway database, then reports best-of-3 wall time and the
+tracemalloc peak for exporting every student and attendance row.
+"""
+import importlib.util
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / "gui sms.py"
+
+
+def load_app():
+    spec = importlib.util.spec_from_file_location("gui_sms", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def populate(path, n_students, n_attendance):
+    con = sqlite3.connect(path)
+    con.executemany(
+        "INSERT INTO students(roll,name,dob,department,email,phone) VALUES (?,?,?,?,?,?)",
+        [(f"R{i:06d}", f"Student {i}", "2001-%02d-%02d" % (i % 12 + 1, i % 28 + 1), "CSE",
+          f"s{i}@example.edu", "98%08d" % i) for i in range(n_students)],
+    )
+    con.executemany(
+        "INSERT INTO attendance(student_id,date,subject,status) VALUES (?,?,?,?)",
+        [(i % n_students + 1, "2024-%02d-%02d" % (i % 12 + 1, i % 28 + 1), "Math", "Present")
+         for i in range(n_attendance)],
+    )
+    con.commit()
+    con.close()
+
+
+def raw_tuples(path, sql):
+    con = sqlite3.connect(path)
+    rows = con.execute(sql).fetchall()
+    con.close()
+    return rows
+
+
+def consume(it):
+    n = 0
+    for _ in it:
+        n += 1
+    return n
+
+
+def measure(fn, repeat=3):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, peak / 2**20
+
+
+def main(n_students=100_000, n_attendance=500_000):
+    sms = load_app()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.db")
+        db = sms.Database(path)
+        populate(path, n_students, n_attendance)
+        cases = [
+            ("students   tuples fetchall", lambda: raw_tuples(
+                path, "SELECT id, roll, name, dob, department, email, phone FROM students ORDER BY roll")),
+            ("           list_students", db.list_students),
+            ("           iter_students", lambda: consume(db.iter_students())),
+            ("attendance tuples fetchall", lambda: raw_tuples(
+                path, "SELECT id, student_id, date, subject, status FROM attendance ORDER BY id")),
+            ("           records, listed", lambda: list(db.iter_attendance())),
+            ("           iter_attendance", lambda: consume(db.iter_attendance())),
+        ]
+        print(f"{n_students} students, {n_attendance} attendance rows (best of 3, tracemalloc peak)")
+        for label, fn in cases:
+            ms, mib = measure(fn)
+            print(f"  {label:28s} {ms:7.0f} ms  {mib:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
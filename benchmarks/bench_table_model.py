@@ -0,0 +1,67 @@
+"""Sort/filter latency of the dashboard TableModel on synthetic student rows.
+
+    python benchmarks/bench_table_model.py [rows]
+
+Measures the in-memory model only; the Treeview reorder is one
+`set_children` call on top of this.
+"""
+import importlib.util
+import random
+import sys
+import time
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / "gui sms.py"
+
+
+def load_app():
+    spec = importlib.util.spec_from_file_location("gui_sms", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(n=50_000):
+    sms = load_app()
+    rng = random.Random(1)
+    rows = [
+        (i, f"R{rng.randrange(10**6):06d}", f"Name {rng.randrange(10**5)}",
+         "2000-01-%02d" % rng.randint(1, 28), rng.choice(["CSE", "ECE", "ME"]),
+         f"u{i}@example.edu", str(rng.randrange(10**9)))
+        for i in range(n)
+    ]
+    model = sms.TableModel(("id", "roll", "name", "dob", "department", "email", "phone"), {"id": sms._int_key})
+
+    def first_sort():
+        model._perm.clear()
+        model.sort("name")
+        model.visible()
+
+    def filter_two():
+        model.set_filter("department", "cs")
+        model.set_filter("name", "12")
+        model.visible()
+
+    results = [
+        ("load + precompute keys", best_of(lambda: model.set_rows(rows))),
+        ("first sort (name)", best_of(first_sort)),
+        ("re-sort/reverse, cached", best_of(lambda: (model.toggle_sort("name"), model.visible()))),
+        ("two-column filter, sorted", best_of(filter_two)),
+        ("baseline: sorted() on tuples", best_of(lambda: sorted(rows, key=lambda r: r[2].casefold()))),
+    ]
+    print(f"TableModel, {n} rows, best of 5")
+    for label, ms in results:
+        print(f"  {label:30s} {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -1,10 +1,244 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sqlite3
-from datetime import datetime
+import logging
+import os
+import smtplib
+import threading
+import time
+import math
+import unicodedata
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from email.message import EmailMessage
+from datetime import date, datetime, timedelta
 
 DB_NAME = 'college_sms.db'
 
+log = logging.getLogger(__name__)
+
+# Low-attendance alerts
+ATTENDANCE_THRESHOLD = 0.75   # alert when a subject's attendance ratio drops below this
+ALERT_MIN_SESSIONS = 5        # don't judge a subject until this many sessions are recorded
+
+# Notification outbox / SMTP (no host configured -> emails stay queued in the outbox)
+SMTP_HOST = os.environ.get("SMS_SMTP_HOST", "")
+SMTP_PORT = int(os.environ.get("SMS_SMTP_PORT", "587"))
+SMTP_USER = os.environ.get("SMS_SMTP_USER", "")
+SMTP_PASSWORD = os.environ.get("SMS_SMTP_PASSWORD", "")
+SMTP_SENDER = os.environ.get("SMS_SMTP_SENDER", "noreply@college.local")
+OUTBOX_BATCH_SIZE = 50
+OUTBOX_RATE_PER_SEC = 5.0     # max messages per second over the shared connection
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_DELAY = 300      # seconds before a rejected message is retried; doubles per attempt
+
+# Duplicate-student detection
+DUP_SIMILARITY = 0.5          # trigram Jaccard score at which two same-DOB names count as duplicates
+
+# ---------------------------- Records ---------------------------- #
+DATE_FORMAT = "%Y-%m-%d"
+
+
+@lru_cache(maxsize=8192)
+def _date_ordinal(value):
+    """Stored date text -> proleptic ordinal int.
+
+    Accepts anything the forms validate with DATE_FORMAT (e.g. '2001-1-5');
+    text that still doesn't parse is returned unchanged so it is never lost.
+    Cached: attendance dates repeat heavily, and sharing the int objects
+    also keeps large result sets smaller.
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        return date.fromisoformat(value).toordinal()
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, DATE_FORMAT).toordinal()
+    except ValueError:
+        return value
+
+
+def _ordinal_iso(n):
+    if isinstance(n, int):
+        return date.fromordinal(n).isoformat()
+    return n if n is not None else ""
+
+
+_new = object.__new__
+
+
+def _iso_date(value):
+    """Normalise a DATE_FORMAT date to zero-padded ISO; other text is left as is."""
+    return _ordinal_iso(_date_ordinal(value))
+
+
+class Student:
+    __slots__ = ('id', 'roll', 'name', 'dob', 'department', 'email', 'phone')
+
+    def __init__(self, id, roll, name, dob, department, email, phone):
+        self.id = id
+        self.roll = roll
+        self.name = name
+        self.dob = dob  # date ordinal (raw text if unparseable)
+        self.department = department
+        self.email = email
+        self.phone = phone
+
+    @classmethod
+    def from_row(cls, cursor, row):
+        # sqlite3 row_factory: (id, roll, name, dob, department, email, phone).
+        # Skips __init__ and fills the slots by unpacking; measurably faster per row.
+        self = _new(cls)
+        self.id, self.roll, self.name, dob, self.department, self.email, self.phone = row
+        self.dob = _date_ordinal(dob)
+        return self
+
+    @property
+    def dob_iso(self):
+        return _ordinal_iso(self.dob)
+
+    def values(self):
+        return (self.id, self.roll, self.name, self.dob_iso, self.department, self.email, self.phone)
+
+    def __repr__(self):
+        return f"Student(id={self.id!r}, roll={self.roll!r}, name={self.name!r})"
+
+
+class Grade:
+    __slots__ = ('id', 'student_id', 'subject', 'term', 'grade')
+
+    def __init__(self, id, student_id, subject, term, grade):
+        self.id = id
+        self.student_id = student_id
+        self.subject = subject
+        self.term = term
+        self.grade = grade
+
+    @classmethod
+    def from_row(cls, cursor, row):
+        # (id, student_id, subject, term, grade)
+        self = _new(cls)
+        self.id, self.student_id, self.subject, self.term, self.grade = row
+        return self
+
+    def values(self):
+        return (self.id, self.subject, self.term, self.grade)
+
+    def __repr__(self):
+        return f"Grade(id={self.id!r}, subject={self.subject!r}, term={self.term!r}, grade={self.grade!r})"
+
+
+class AttendanceRecord:
+    __slots__ = ('id', 'student_id', 'date', 'subject', 'status')
+
+    def __init__(self, id, student_id, date, subject, status):
+        self.id = id
+        self.student_id = student_id
+        self.date = date  # date ordinal (raw text if unparseable)
+        self.subject = subject
+        self.status = status
+
+    @classmethod
+    def from_row(cls, cursor, row):
+        # (id, student_id, date, subject, status)
+        self = _new(cls)
+        self.id, self.student_id, day, self.subject, self.status = row
+        self.date = _date_ordinal(day)
+        return self
+
+    @property
+    def date_iso(self):
+        return _ordinal_iso(self.date)
+
+    def values(self):
+        return (self.id, self.date_iso, self.subject, self.status)
+
+    def __repr__(self):
+        return f"AttendanceRecord(id={self.id!r}, date={self.date_iso!r}, subject={self.subject!r}, status={self.status!r})"
+
+
+class AlertRecord:
+    __slots__ = ('student_id', 'roll', 'name', 'subject', 'ratio', 'raised_at')
+
+    def __init__(self, student_id, roll, name, subject, ratio, raised_at):
+        self.student_id = student_id
+        self.roll = roll
+        self.name = name
+        self.subject = subject
+        self.ratio = ratio  # present / total, 0..1
+        self.raised_at = raised_at
+
+    @classmethod
+    def from_row(cls, cursor, row):
+        # (student_id, roll, name, subject, ratio, raised_at)
+        return cls(*row)
+
+    def values(self):
+        return (self.roll, self.name, self.subject, f"{self.ratio:.0%}", self.raised_at)
+
+    def __repr__(self):
+        return f"AlertRecord(roll={self.roll!r}, subject={self.subject!r}, ratio={self.ratio:.2f})"
+
+
+FETCH_BATCH_SIZE = 1000
+
+
+def name_trigrams(name):
+    """Trigram set of a normalized name (accents, punctuation, case and word order ignored)."""
+    text = unicodedata.normalize('NFKD', name or "")
+    text = "".join(ch if ch.isalnum() else " " for ch in text if not unicodedata.combining(ch))
+    text = " ".join(sorted(text.casefold().split()))
+    if not text:
+        return set()
+    text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _block_duplicate_pairs(rows, threshold):
+    """Similar pairs among one DOB's (dob, gram, student_id) rows, sorted by gram.
+
+    Prefix filtering: with grams ordered rarest-first within the DOB, two
+    sets with Jaccard >= threshold must share one of the first
+    size - ceil(threshold * size) + 1 grams, so only those are indexed.
+    Returns [(id_a, id_b, score)].
+    """
+    sizes = {}
+    shared = {}  # student -> [(block size, gram)] for grams other students also have
+    for gram, grp in groupby(rows, key=itemgetter(1)):
+        ids = [r[2] for r in grp]
+        for sid in ids:
+            sizes[sid] = sizes.get(sid, 0) + 1
+        if len(ids) > 1:
+            key = (len(ids), gram)
+            for sid in ids:
+                shared.setdefault(sid, []).append(key)
+    index = {}
+    pairs = []
+    for sid in sorted(shared):
+        keys = shared[sid]
+        size = sizes[sid]
+        # Grams unique to this student lead the rarest-first order but can never match
+        prefix = len(keys) - math.ceil(threshold * size) + 1
+        if prefix <= 0:
+            continue
+        keys.sort()
+        candidates = set()
+        for key in keys[:prefix]:
+            seen = index.setdefault(key, [])
+            candidates.update(seen)
+            seen.append(sid)
+        if candidates:
+            mine = set(keys)
+            for other in candidates:
+                common = len(mine.intersection(shared[other]))
+                score = common / (size + sizes[other] - common)
+                if score >= threshold:
+                    pairs.append((other, sid, score))
+    return pairs
+
 # ---------------------------- Database Layer ---------------------------- #
 class Database:
     def __init__(self, db_path=DB_NAME):
@@ -65,6 +299,92 @@ class Database:
             );
             """
         )
+        # Running per-subject totals, kept in step with attendance writes so
+        # alert checks never have to rescan the attendance history.
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS attendance_stats (
+                student_id INTEGER NOT NULL,
+                subject TEXT NOT NULL,
+                total INTEGER NOT NULL DEFAULT 0,
+                present INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (student_id, subject)
+            );
+            """
+        )
+        # One row per open alert; the primary key is what deduplicates them.
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS attendance_alerts (
+                student_id INTEGER NOT NULL,
+                subject TEXT NOT NULL,
+                ratio REAL NOT NULL,
+                raised_at TEXT NOT NULL,
+                PRIMARY KEY (student_id, subject)
+            );
+            """
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recipient TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                body TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                sent_at TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                next_attempt_at TEXT -- rejected messages wait until then
+            );
+            """
+        )
+        cur.execute("PRAGMA table_info(outbox)")
+        if "next_attempt_at" not in {r[1] for r in cur.fetchall()}:
+            cur.execute("ALTER TABLE outbox ADD COLUMN next_attempt_at TEXT")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_outbox_pending ON outbox(sent_at, id)")
+        # Backfill stats once for databases created before the table existed
+        cur.execute("SELECT COUNT(*) FROM attendance_stats")
+        if cur.fetchone()[0] == 0:
+            cur.execute(
+                """
+                INSERT INTO attendance_stats(student_id, subject, total, present)
+                SELECT student_id, subject, COUNT(*), SUM(status='Present')
+                FROM attendance GROUP BY student_id, subject
+                """
+            )
+            # ...and raise alerts for anyone already below the threshold
+            cur.execute(
+                "SELECT student_id, subject FROM attendance_stats WHERE total >= ? AND present < total * ?",
+                (ALERT_MIN_SESSIONS, ATTENDANCE_THRESHOLD),
+            )
+            for sid, subject in cur.fetchall():
+                self._evaluate_alert(cur, sid, subject)
+        # Blocking index for duplicate detection: one row per (student, name trigram),
+        # matched only within the same DOB.
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS student_name_index (
+                student_id INTEGER NOT NULL,
+                dob TEXT NOT NULL,
+                gram TEXT NOT NULL,
+                PRIMARY KEY (dob, gram, student_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_name_index_student ON student_name_index(student_id)")
+        # DOBs are blocked on exactly, so rewrite any unpadded ones ('2001-1-5') to ISO
+        for table in ("students", "student_name_index"):
+            cur.execute(f"SELECT DISTINCT dob FROM {table} WHERE length(dob) != 10")
+            for (old,) in cur.fetchall():
+                new = _iso_date(old)
+                if new != old:
+                    cur.execute(f"UPDATE {table} SET dob=? WHERE dob=?", (new, old))
+        cur.execute("SELECT COUNT(*) FROM student_name_index")
+        if cur.fetchone()[0] == 0:
+            cur.execute("SELECT id, name, dob FROM students")
+            for sid, name, dob in cur.fetchall():
+                self._index_student(cur, sid, name, dob)
         # Seed a default teacher if not exists
         cur.execute("SELECT COUNT(*) FROM teachers")
         if cur.fetchone()[0] == 0:
@@ -93,7 +413,7 @@ class Database:
         cur = con.cursor()
         cur.execute(
             "SELECT id, name FROM students WHERE roll=? AND dob=?",
-            (roll, dob),
+            (roll, _iso_date(dob)),
         )
         row = cur.fetchone()
         con.close()
@@ -101,16 +421,19 @@ class Database:
 
     # Student CRUD
     def add_student(self, roll, name, dob, department, email, phone):
+        dob = _iso_date(dob)
         con = self._connect()
         cur = con.cursor()
         cur.execute(
             "INSERT INTO students(roll,name,dob,department,email,phone) VALUES (?,?,?,?,?,?)",
             (roll, name, dob, department, email, phone),
         )
+        self._index_student(cur, cur.lastrowid, name, dob)
         con.commit()
         con.close()
 
     def update_student(self, student_id, roll, name, dob, department, email, phone):
+        dob = _iso_date(dob)
         con = self._connect()
         cur = con.cursor()
         cur.execute(
@@ -120,6 +443,8 @@ class Database:
             """,
             (roll, name, dob, department, email, phone, student_id),
         )
+        cur.execute("DELETE FROM student_name_index WHERE student_id=?", (student_id,))
+        self._index_student(cur, student_id, name, dob)
         con.commit()
         con.close()
 
@@ -127,26 +452,107 @@ class Database:
         con = self._connect()
         cur = con.cursor()
         cur.execute("DELETE FROM students WHERE id=?", (student_id,))
+        cur.execute("DELETE FROM attendance_stats WHERE student_id=?", (student_id,))
+        cur.execute("DELETE FROM attendance_alerts WHERE student_id=?", (student_id,))
+        cur.execute("DELETE FROM student_name_index WHERE student_id=?", (student_id,))
         con.commit()
         con.close()
 
+    def _student_query(self, q):
+        sql = "SELECT id, roll, name, dob, department, email, phone FROM students"
+        if q:
+            pattern = f"%{q}%"
+            return sql + " WHERE roll LIKE ? OR name LIKE ? OR department LIKE ? ORDER BY roll", (pattern, pattern, pattern)
+        return sql + " ORDER BY roll", ()
+
     def list_students(self, q=""):
         con = self._connect()
+        con.row_factory = Student.from_row
         cur = con.cursor()
-        if q:
-            pattern = f"%{q}%"
-            cur.execute(
-                "SELECT id, roll, name, dob, department, email, phone FROM students\n                 WHERE roll LIKE ? OR name LIKE ? OR department LIKE ? ORDER BY roll",
-                (pattern, pattern, pattern),
-            )
-        else:
-            cur.execute(
-                "SELECT id, roll, name, dob, department, email, phone FROM students ORDER BY roll"
-            )
+        cur.execute(*self._student_query(q))
         rows = cur.fetchall()
         con.close()
         return rows
 
+    def iter_students(self, q="", batch_size=FETCH_BATCH_SIZE):
+        """Like list_students but streams Student records with fetchmany."""
+        con = self._connect()
+        con.row_factory = Student.from_row
+        try:
+            cur = con.cursor()
+            cur.execute(*self._student_query(q))
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            con.close()
+
+    # Duplicate detection
+    def _index_student(self, cur, student_id, name, dob):
+        cur.executemany(
+            "INSERT OR IGNORE INTO student_name_index(student_id, dob, gram) VALUES (?,?,?)",
+            [(student_id, _iso_date(dob), g) for g in name_trigrams(name)],
+        )
+
+    def find_duplicates(self, name, dob, exclude_id=None):
+        """Existing students with the same DOB and a similar name, as [(Student, score)] best first."""
+        grams = name_trigrams(name)
+        if not grams:
+            return []
+        con = self._connect()
+        cur = con.cursor()
+        cur.execute(
+            f"""
+            SELECT i.student_id, COUNT(*),
+                   (SELECT COUNT(*) FROM student_name_index j WHERE j.student_id = i.student_id)
+            FROM student_name_index i
+            WHERE i.dob=? AND i.gram IN ({",".join("?" * len(grams))})
+            GROUP BY i.student_id
+            """,
+            (_iso_date(dob), *grams),
+        )
+        scores = {}
+        for sid, shared, total in cur.fetchall():
+            score = shared / (len(grams) + total - shared)
+            if sid != exclude_id and score >= DUP_SIMILARITY:
+                scores[sid] = score
+        students = self._students_by_id(con, scores)
+        con.close()
+        return sorted(((students[sid], sc) for sid, sc in scores.items()), key=lambda p: -p[1])
+
+    def find_all_duplicates(self):
+        """Probable duplicate pairs across the table, as [(Student, Student, score)] best first.
+
+        Streams the index in primary-key order, one DOB at a time, so time
+        grows with the number of index rows and memory with the largest DOB.
+        """
+        con = self._connect()
+        cur = con.cursor()
+        cur.execute("SELECT dob, gram, student_id FROM student_name_index ORDER BY dob, gram, student_id")
+        pairs = []
+        for _dob, rows in groupby(cur, key=itemgetter(0)):
+            pairs.extend(_block_duplicate_pairs(rows, DUP_SIMILARITY))
+        students = self._students_by_id(con, {sid for a, b, _ in pairs for sid in (a, b)})
+        con.close()
+        pairs.sort(key=lambda p: -p[2])
+        return [(students[a], students[b], score) for a, b, score in pairs]
+
+    def _students_by_id(self, con, ids):
+        ids = list(ids)
+        found = {}
+        cur = con.cursor()
+        cur.row_factory = Student.from_row
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            cur.execute(
+                f"SELECT id, roll, name, dob, department, email, phone FROM students WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            found.update((st.id, st) for st in cur.fetchall())
+        return found
+
     # Grades
     def add_grade(self, student_id, subject, term, grade):
         con = self._connect()
@@ -160,9 +566,10 @@ class Database:
 
     def list_grades(self, student_id):
         con = self._connect()
+        con.row_factory = Grade.from_row
         cur = con.cursor()
         cur.execute(
-            "SELECT id, subject, term, grade FROM grades WHERE student_id=? ORDER BY term, subject",
+            "SELECT id, student_id, subject, term, grade FROM grades WHERE student_id=? ORDER BY term, subject",
             (student_id,),
         )
         rows = cur.fetchall()
@@ -178,36 +585,215 @@ class Database:
 
     # Attendance
     def add_attendance(self, student_id, date, subject, status):
+        """Insert one record; returns the number of new low-attendance alerts."""
+        return self.add_attendance_bulk([(student_id, date, subject, status)])
+
+    def add_attendance_bulk(self, records):
+        """Insert many (student_id, date, subject, status) records in one transaction.
+
+        Stats are bumped per record and each touched (student, subject) pair is
+        re-evaluated once, so a whole roll-call costs a single commit.
+        Returns the number of new low-attendance alerts.
+        """
+        records = [(sid, _iso_date(day), subject, status) for sid, day, subject, status in records]
+        if not records:
+            return 0
         con = self._connect()
         cur = con.cursor()
-        cur.execute(
+        cur.executemany(
             "INSERT INTO attendance(student_id, date, subject, status) VALUES (?,?,?,?)",
-            (student_id, date, subject, status),
+            records,
         )
+        cur.executemany(
+            """
+            INSERT INTO attendance_stats(student_id, subject, total, present) VALUES (?,?,1,?)
+            ON CONFLICT(student_id, subject) DO UPDATE SET
+                total = total + 1, present = present + excluded.present
+            """,
+            [(sid, subject, int(status == 'Present')) for sid, _date, subject, status in records],
+        )
+        raised = 0
+        for sid, subject in dict.fromkeys((r[0], r[2]) for r in records):
+            raised += self._evaluate_alert(cur, sid, subject)
         con.commit()
         con.close()
+        return raised
+
+    def add_department_attendance(self, department, date, subject, status):
+        """Mark every student of a department; returns (records added, alerts raised)."""
+        con = self._connect()
+        cur = con.cursor()
+        cur.execute("SELECT id FROM students WHERE department=?", (department,))
+        ids = [r[0] for r in cur.fetchall()]
+        con.close()
+        raised = self.add_attendance_bulk((sid, date, subject, status) for sid in ids)
+        return len(ids), raised
 
     def list_attendance(self, student_id):
         con = self._connect()
+        con.row_factory = AttendanceRecord.from_row
         cur = con.cursor()
         cur.execute(
-            "SELECT id, date, subject, status FROM attendance WHERE student_id=? ORDER BY date DESC",
+            "SELECT id, student_id, date, subject, status FROM attendance WHERE student_id=? ORDER BY date DESC",
             (student_id,),
         )
         rows = cur.fetchall()
         con.close()
         return rows
 
+    def iter_attendance(self, student_id=None, batch_size=FETCH_BATCH_SIZE):
+        """Stream AttendanceRecords (all students when student_id is None) with fetchmany."""
+        con = self._connect()
+        con.row_factory = AttendanceRecord.from_row
+        try:
+            cur = con.cursor()
+            if student_id is None:
+                cur.execute("SELECT id, student_id, date, subject, status FROM attendance ORDER BY id")
+            else:
+                cur.execute(
+                    "SELECT id, student_id, date, subject, status FROM attendance WHERE student_id=? ORDER BY date DESC",
+                    (student_id,),
+                )
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            con.close()
+
     def delete_attendance(self, att_id):
         con = self._connect()
         cur = con.cursor()
+        cur.execute("SELECT student_id, subject, status FROM attendance WHERE id=?", (att_id,))
+        row = cur.fetchone()
         cur.execute("DELETE FROM attendance WHERE id=?", (att_id,))
+        if row:
+            sid, subject, status = row
+            cur.execute(
+                "UPDATE attendance_stats SET total = total - 1, present = present - ? WHERE student_id=? AND subject=?",
+                (int(status == 'Present'), sid, subject),
+            )
+            self._evaluate_alert(cur, sid, subject)
+        con.commit()
+        con.close()
+
+    def _evaluate_alert(self, cur, student_id, subject):
+        """Raise or clear the alert for one (student, subject); returns 1 if newly raised."""
+        cur.execute(
+            "SELECT total, present FROM attendance_stats WHERE student_id=? AND subject=?",
+            (student_id, subject),
+        )
+        row = cur.fetchone()
+        if not row or row[0] < ALERT_MIN_SESSIONS or row[1] / row[0] >= ATTENDANCE_THRESHOLD:
+            # Recovered (or not enough data): clear so a later drop alerts again
+            cur.execute(
+                "DELETE FROM attendance_alerts WHERE student_id=? AND subject=?",
+                (student_id, subject),
+            )
+            return 0
+        total, present = row
+        ratio = present / total
+        now = datetime.now().isoformat(timespec='seconds')
+        cur.execute(
+            "INSERT OR IGNORE INTO attendance_alerts(student_id, subject, ratio, raised_at) VALUES (?,?,?,?)",
+            (student_id, subject, ratio, now),
+        )
+        if cur.rowcount == 0:
+            return 0  # already alerted for this drop
+        cur.execute("SELECT name, email FROM students WHERE id=?", (student_id,))
+        student = cur.fetchone()
+        if student and student[1]:
+            name, email = student
+            body = (
+                f"Dear {name},\n\n"
+                f"Your attendance in {subject} is {ratio:.0%} ({present} of {total} sessions), "
+                f"below the required {ATTENDANCE_THRESHOLD:.0%}.\n"
+                "Please contact your teacher.\n"
+            )
+            cur.execute(
+                "INSERT INTO outbox(recipient, subject, body, created_at) VALUES (?,?,?,?)",
+                (email, f"Low attendance warning: {subject}", body, now),
+            )
+        return 1
+
+    def list_alerts(self):
+        con = self._connect()
+        con.row_factory = AlertRecord.from_row
+        cur = con.cursor()
+        cur.execute(
+            """
+            SELECT a.student_id, s.roll, s.name, a.subject, a.ratio, a.raised_at
+            FROM attendance_alerts a JOIN students s ON s.id = a.student_id
+            ORDER BY a.raised_at DESC
+            """
+        )
+        rows = cur.fetchall()
+        con.close()
+        return rows
+
+    # Notification outbox
+    def fetch_outbox(self, limit=OUTBOX_BATCH_SIZE):
+        """Unsent messages that are due, oldest first."""
+        now = datetime.now().isoformat(timespec='seconds')
+        con = self._connect()
+        cur = con.cursor()
+        cur.execute(
+            """
+            SELECT id, recipient, subject, body FROM outbox
+            WHERE sent_at IS NULL AND attempts < ? AND (next_attempt_at IS NULL OR next_attempt_at <= ?)
+            ORDER BY id LIMIT ?
+            """,
+            (OUTBOX_MAX_ATTEMPTS, now, limit),
+        )
+        rows = cur.fetchall()
+        con.close()
+        return rows
+
+    def mark_outbox_sent(self, ids):
+        if not ids:
+            return
+        now = datetime.now().isoformat(timespec='seconds')
+        con = self._connect()
+        cur = con.cursor()
+        cur.executemany(
+            "UPDATE outbox SET sent_at=?, attempts = attempts + 1, last_error=NULL WHERE id=?",
+            [(now, i) for i in ids],
+        )
+        con.commit()
+        con.close()
+
+    def mark_outbox_failed(self, msg_id, error):
+        """Count a rejected attempt and defer the retry (OUTBOX_RETRY_DELAY, doubling)."""
+        con = self._connect()
+        cur = con.cursor()
+        cur.execute("SELECT attempts FROM outbox WHERE id=?", (msg_id,))
+        row = cur.fetchone()
+        delay = OUTBOX_RETRY_DELAY * 2 ** (row[0] if row else 0)
+        retry_at = (datetime.now() + timedelta(seconds=delay)).isoformat(timespec='seconds')
+        cur.execute(
+            "UPDATE outbox SET attempts = attempts + 1, last_error=?, next_attempt_at=? WHERE id=?",
+            (str(error), retry_at, msg_id),
+        )
         con.commit()
         con.close()
 
     # Utility
+    def get_student(self, student_id):
+        con = self._connect()
+        con.row_factory = Student.from_row
+        cur = con.cursor()
+        cur.execute(
+            "SELECT id, roll, name, dob, department, email, phone FROM students WHERE id=?",
+            (student_id,),
+        )
+        row = cur.fetchone()
+        con.close()
+        return row
+
     def get_student_by_roll(self, roll):
         con = self._connect()
+        con.row_factory = Student.from_row
         cur = con.cursor()
         cur.execute(
             "SELECT id, roll, name, dob, department, email, phone FROM students WHERE roll=?",
@@ -217,6 +803,128 @@ class Database:
         con.close()
         return row
 
+# ---------------------------- Notifications ---------------------------- #
+def default_smtp_factory():
+    smtp = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+    smtp.starttls()
+    if SMTP_USER:
+        smtp.login(SMTP_USER, SMTP_PASSWORD)
+    return smtp
+
+
+def _is_connection_error(exc):
+    """True if `exc` means the server/connection is unusable rather than one message being bad."""
+    if isinstance(exc, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, smtplib.SMTPAuthenticationError)):
+        return True
+    if isinstance(exc, smtplib.SMTPException):
+        return False  # server replied about this message (SMTPException subclasses OSError)
+    return isinstance(exc, OSError)  # DNS, unreachable network, reset, timeout...
+
+
+class NotificationWorker(threading.Thread):
+    """Background thread draining the outbox in batches over one SMTP connection.
+
+    The connection is opened lazily, reused across batches and dropped after
+    `idle_timeout` seconds without work. Sends are spaced to `rate` per second.
+    """
+
+    def __init__(self, db, smtp_factory=default_smtp_factory, batch_size=OUTBOX_BATCH_SIZE,
+                 rate=OUTBOX_RATE_PER_SEC, poll_interval=30, idle_timeout=60):
+        super().__init__(daemon=True)
+        self.db = db
+        self.smtp_factory = smtp_factory
+        self.batch_size = batch_size
+        self.interval = 1.0 / rate if rate else 0
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self._smtp = None
+        self._last_used = 0.0
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+    def wake(self):
+        self._wake.set()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                handled = self.drain()
+            except Exception:
+                log.exception("Outbox batch aborted; retrying in %ss", self.poll_interval)
+                handled = 0
+                self._close()
+            if handled:
+                continue  # more may be due; failed ones are deferred, so no hot retry loop
+            if self._smtp and time.monotonic() - self._last_used > self.idle_timeout:
+                self._close()
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+        self._close()
+
+    def drain(self):
+        """Send one batch; returns the number of messages handled (sent or failed).
+
+        The connection is opened once per batch; failing to open it, or any
+        connection error mid-batch, propagates and leaves the rest pending
+        with no attempt counted. A message that can't be built or is rejected
+        is marked failed (and deferred) and the batch goes on.
+        """
+        batch = self.db.fetch_outbox(self.batch_size)
+        if not batch:
+            return 0
+        if self._smtp is None:
+            self._smtp = self.smtp_factory()
+        sent_ids = []
+        failed = 0
+        try:
+            for msg_id, recipient, subject, body in batch:
+                if self._stopping.is_set():
+                    break
+                try:
+                    msg = EmailMessage()
+                    msg["From"] = SMTP_SENDER
+                    msg["To"] = recipient
+                    msg["Subject"] = subject
+                    msg.set_content(body)
+                    self._send(msg)
+                    sent_ids.append(msg_id)
+                except Exception as e:
+                    if _is_connection_error(e):
+                        raise
+                    log.warning("Outbox message %s to %s failed: %s", msg_id, recipient, e)
+                    self.db.mark_outbox_failed(msg_id, e)
+                    failed += 1
+                if self.interval:
+                    self._stopping.wait(self.interval)
+        finally:
+            self.db.mark_outbox_sent(sent_ids)
+        return len(sent_ids) + failed
+
+    def _send(self, msg):
+        try:
+            self._smtp.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Pooled connection went stale; reconnect once and retry
+            self._smtp = None
+            try:
+                self._smtp = self.smtp_factory()
+            except Exception as e:
+                raise smtplib.SMTPServerDisconnected(f"reconnect failed: {e}") from e
+            self._smtp.send_message(msg)
+        self._last_used = time.monotonic()
+
+    def _close(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
 # ---------------------------- UI Helpers ---------------------------- #
 class LabeledEntry(ttk.Frame):
     def __init__(self, master, text, **kwargs):
@@ -233,6 +941,142 @@ class LabeledEntry(ttk.Frame):
     def set(self, value):
         self.var.set(value if value is not None else "")
 
+
+def _text_key(v):
+    return "" if v is None else str(v).casefold()
+
+
+def _int_key(v):
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return -1
+
+
+class TableModel:
+    """Column-major copy of loaded rows with precomputed sort/filter keys.
+
+    Sorting a column builds its index permutation once and caches it, so
+    later sorts (either direction) on that column are only a list reversal.
+    Filters are case-insensitive substring matches per column. Sort and
+    filters are view state and survive set_rows().
+    """
+
+    def __init__(self, columns, types=None):
+        self.columns = tuple(columns)
+        types = types or {}
+        self.key_funcs = [types.get(c, _text_key) for c in self.columns]
+        self.filters = {}
+        self.sort_col = None
+        self.descending = False
+        self.set_rows([])
+
+    def set_rows(self, rows):
+        self.rows = [tuple(r) for r in rows]
+        n = len(self.columns)
+        self.data = [[r[i] for r in self.rows] for i in range(n)]
+        self.keys = [list(map(f, col)) for f, col in zip(self.key_funcs, self.data)]
+        self._folded = [None] * n  # lowercase text per column, built on first filter
+        self._perm = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def sort(self, col, descending=False):
+        self.sort_col = col
+        self.descending = descending
+
+    def toggle_sort(self, col):
+        self.sort(col, not self.descending if self.sort_col == col else False)
+
+    def set_filter(self, col, text):
+        text = text.strip().casefold()
+        if text:
+            self.filters[col] = text
+        else:
+            self.filters.pop(col, None)
+
+    def _order(self):
+        if self.sort_col is None:
+            return range(len(self.rows))
+        i = self.columns.index(self.sort_col)
+        perm = self._perm.get(i)
+        if perm is None:
+            perm = self._perm[i] = sorted(range(len(self.rows)), key=self.keys[i].__getitem__)
+        return reversed(perm) if self.descending else perm
+
+    def visible(self):
+        """Row indices after filtering, in display order."""
+        rows = list(self._order())
+        for col, text in self.filters.items():
+            i = self.columns.index(col)
+            if self._folded[i] is None:
+                self._folded[i] = [_text_key(v) for v in self.data[i]]
+            folded = self._folded[i]
+            rows = [r for r in rows if text in folded[r]]
+        return rows
+
+
+class SortFilterTree:
+    """Clickable headers and per-column filter boxes for a headings Treeview.
+
+    Rows are inserted once per load with their index as iid; sorting and
+    filtering then reorder/detach the existing items with a single
+    `set_children` call instead of rebuilding the tree.
+    """
+
+    def __init__(self, tree, filter_parent, types=None):
+        self.tree = tree
+        self.model = TableModel(tree['columns'], types)
+        self.titles = {c: tree.heading(c, 'text') for c in self.model.columns}
+        self._pending = None
+        for c in self.model.columns:
+            tree.heading(c, command=lambda c=c: self.on_heading(c))
+
+        # One labelled filter box per column, gridded to the column widths
+        bar = ttk.Frame(filter_parent)
+        bar.pack(fill=tk.X, pady=(0,4), before=tree)
+        self.filter_vars = {}
+        for i, c in enumerate(self.model.columns):
+            bar.columnconfigure(i, minsize=tree.column(c, 'width'))
+            ttk.Label(bar, text=f"Filter {self.titles[c]}", foreground="#666").grid(row=0, column=i, sticky='w', padx=1)
+            var = tk.StringVar()
+            var.trace_add('write', lambda *_: self._schedule_filter())
+            ttk.Entry(bar, textvariable=var, width=1).grid(row=1, column=i, sticky='ew', padx=1)
+            self.filter_vars[c] = var
+
+    def set_rows(self, rows):
+        """Replace the tree contents; current sort and filters are kept."""
+        if len(self.model):
+            self.tree.delete(*map(str, range(len(self.model))))
+        self.model.set_rows(rows)
+        for i, row in enumerate(self.model.rows):
+            self.tree.insert('', tk.END, iid=str(i), values=row)
+        self.apply()
+
+    def on_heading(self, col):
+        self.model.toggle_sort(col)
+        self.apply()
+
+    def _schedule_filter(self):
+        if self._pending:
+            self.tree.after_cancel(self._pending)
+        self._pending = self.tree.after(150, self._apply_filters)
+
+    def _apply_filters(self):
+        self._pending = None
+        for c, var in self.filter_vars.items():
+            self.model.set_filter(c, var.get())
+        self.apply()
+
+    def apply(self):
+        self.tree.set_children('', *map(str, self.model.visible()))
+        for c in self.model.columns:
+            arrow = ""
+            if c == self.model.sort_col:
+                arrow = " \u25bc" if self.model.descending else " \u25b2"
+            self.tree.heading(c, text=self.titles[c] + arrow)
+
 # ---------------------------- Main Application ---------------------------- #
 class App(tk.Tk):
     def __init__(self):
@@ -241,6 +1085,11 @@ class App(tk.Tk):
         self.geometry("980x640")
         self.minsize(960, 600)
         self.db = Database()
+        # Without an SMTP host the outbox just accumulates until one is configured
+        self.notifier = NotificationWorker(self.db) if SMTP_HOST else None
+        if self.notifier:
+            self.notifier.start()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         self._style()
         self.container = ttk.Frame(self)
         self.container.pack(fill=tk.BOTH, expand=True)
@@ -262,6 +1111,16 @@ class App(tk.Tk):
         style.configure("Card.TFrame", background="#f7f7fb")
         style.configure("Header.TLabel", font=("Segoe UI", 18, "bold"))
 
+    def notify(self):
+        """Nudge the outbox worker after new alerts were queued."""
+        if self.notifier:
+            self.notifier.wake()
+
+    def on_close(self):
+        if self.notifier:
+            self.notifier.stop()
+        self.destroy()
+
     def show(self, name, **kwargs):
         frame = self.frames[name]
         if hasattr(frame, 'on_show'):
@@ -350,6 +1209,7 @@ class TeacherDashboard(ttk.Frame):
         self.app = app
         self.teacher_id = None
         self.teacher_name = None
+        self.students = []
 
         # Header
         top = ttk.Frame(self)
@@ -365,14 +1225,17 @@ class TeacherDashboard(ttk.Frame):
         self.tab_students = ttk.Frame(self.nb, padding=10)
         self.tab_grades = ttk.Frame(self.nb, padding=10)
         self.tab_att = ttk.Frame(self.nb, padding=10)
+        self.tab_alerts = ttk.Frame(self.nb, padding=10)
 
         self.nb.add(self.tab_students, text="Students")
         self.nb.add(self.tab_grades, text="Grades")
         self.nb.add(self.tab_att, text="Attendance")
+        self.nb.add(self.tab_alerts, text="Alerts")
 
         self._build_students_tab()
         self._build_grades_tab()
         self._build_attendance_tab()
+        self._build_alerts_tab()
 
     def on_show(self, teacher_id, teacher_name):
         self.teacher_id = teacher_id
@@ -381,6 +1244,7 @@ class TeacherDashboard(ttk.Frame):
         self.refresh_students()
         self.refresh_grade_students()
         self.refresh_att_students()
+        self.refresh_alerts()
 
     # ---- Students Tab ---- #
     def _build_students_tab(self):
@@ -406,6 +1270,8 @@ class TeacherDashboard(ttk.Frame):
         ttk.Button(btns, text="Update", command=self.update_student).grid(row=0, column=1, padx=4)
         ttk.Button(btns, text="Delete", command=self.delete_student).grid(row=0, column=2, padx=4)
         ttk.Button(btns, text="Clear", command=self.clear_student_form).grid(row=0, column=3, padx=4)
+        self.dup_btn = ttk.Button(btns, text="Find Duplicates", command=self.show_duplicates)
+        self.dup_btn.grid(row=1, column=0, columnspan=4, pady=(6,0))
 
         # Search
         sea = ttk.Frame(right)
@@ -424,27 +1290,25 @@ class TeacherDashboard(ttk.Frame):
         self.tree.column("id", width=40)
         self.tree.pack(fill=tk.BOTH, expand=True)
         self.tree.bind('<<TreeviewSelect>>', self.on_student_select)
+        self.tree_view = SortFilterTree(self.tree, right, types={"id": _int_key})
 
     def refresh_students(self):
         q = self.search_var.get().strip() if hasattr(self, 'search_var') else ""
-        for r in self.tree.get_children():
-            self.tree.delete(r)
-        for row in self.app.db.list_students(q):
-            self.tree.insert('', tk.END, values=row)
+        self.students = self.app.db.list_students(q)
+        self.tree_view.set_rows(st.values() for st in self.students)
 
     def on_student_select(self, event=None):
         sel = self.tree.selection()
         if not sel:
             return
-        vals = self.tree.item(sel[0], 'values')
-        sid, roll, name, dob, dept, email, phone = vals
-        self.selected_student_id = int(sid)
-        self.s_roll.set(roll)
-        self.s_name.set(name)
-        self.s_dob.set(dob)
-        self.s_dept.set(dept)
-        self.s_email.set(email)
-        self.s_phone.set(phone)
+        st = self.students[int(sel[0])]  # iid is the row index
+        self.selected_student_id = st.id
+        self.s_roll.set(st.roll)
+        self.s_name.set(st.name)
+        self.s_dob.set(st.dob_iso)
+        self.s_dept.set(st.department)
+        self.s_email.set(st.email)
+        self.s_phone.set(st.phone)
 
     def clear_student_form(self):
         self.selected_student_id = None
@@ -457,7 +1321,9 @@ class TeacherDashboard(ttk.Frame):
             if not (roll and name and dob):
                 raise ValueError("Roll, Name, DOB are required.")
             # basic date validation
-            datetime.strptime(dob, "%Y-%m-%d")
+            datetime.strptime(dob, DATE_FORMAT)
+            if not self._confirm_not_duplicate(name, dob, "Add anyway?"):
+                return
             self.app.db.add_student(roll, name, dob, self.s_dept.get(), self.s_email.get(), self.s_phone.get())
             messagebox.showinfo("Success", "Student added.")
             self.refresh_students()
@@ -465,6 +1331,13 @@ class TeacherDashboard(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def _confirm_not_duplicate(self, name, dob, question, exclude_id=None):
+        dups = self.app.db.find_duplicates(name, dob, exclude_id=exclude_id)
+        if not dups:
+            return True
+        lines = "\n".join(f"{st.roll} – {st.name} ({score:.0%} match)" for st, score in dups[:5])
+        return messagebox.askyesno("Possible Duplicate", f"Similar students with the same DOB already exist:\n\n{lines}\n\n{question}")
+
     def update_student(self):
         try:
             if not hasattr(self, 'selected_student_id') or not self.selected_student_id:
@@ -472,7 +1345,9 @@ class TeacherDashboard(ttk.Frame):
             roll = self.s_roll.get(); name = self.s_name.get(); dob = self.s_dob.get()
             if not (roll and name and dob):
                 raise ValueError("Roll, Name, DOB are required.")
-            datetime.strptime(dob, "%Y-%m-%d")
+            datetime.strptime(dob, DATE_FORMAT)
+            if not self._confirm_not_duplicate(name, dob, "Update anyway?", exclude_id=self.selected_student_id):
+                return
             self.app.db.update_student(self.selected_student_id, roll, name, dob, self.s_dept.get(), self.s_email.get(), self.s_phone.get())
             messagebox.showinfo("Success", "Student updated.")
             self.refresh_students()
@@ -490,6 +1365,46 @@ class TeacherDashboard(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def show_duplicates(self):
+        result = {}
+
+        def work():
+            try:
+                result['value'] = self.app.db.find_all_duplicates()
+            except Exception as e:
+                result['error'] = e
+
+        worker = threading.Thread(target=work, daemon=True)
+        self.dup_btn.config(state=tk.DISABLED)
+        worker.start()
+        self.after(100, self._poll_duplicates, worker, result)
+
+    def _poll_duplicates(self, worker, result):
+        if worker.is_alive():
+            self.after(100, self._poll_duplicates, worker, result)
+            return
+        self.dup_btn.config(state=tk.NORMAL)
+        if 'error' in result:
+            messagebox.showerror("Error", str(result['error']))
+            return
+        pairs = result['value']
+        if not pairs:
+            messagebox.showinfo("Duplicates", "No probable duplicates found.")
+            return
+        win = tk.Toplevel(self)
+        win.title(f"Probable Duplicates ({len(pairs)})")
+        win.geometry("860x420")
+        frame = ttk.Frame(win, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        cols = ("score","dob","roll_a","name_a","roll_b","name_b")
+        tree = ttk.Treeview(frame, columns=cols, show='headings')
+        for c, text in zip(cols, ("Score","DOB","Roll A","Name A","Roll B","Name B")):
+            tree.heading(c, text=text)
+            tree.column(c, width=70 if c in ("score","dob") else 150, anchor=tk.W)
+        tree.pack(fill=tk.BOTH, expand=True)
+        view = SortFilterTree(tree, frame)
+        view.set_rows((f"{score:.2f}", a.dob_iso, a.roll, a.name, b.roll, b.name) for a, b, score in pairs)
+
     # ---- Grades Tab ---- #
     def _build_grades_tab(self):
         wrapper = ttk.Frame(self.tab_grades)
@@ -515,6 +1430,7 @@ class TeacherDashboard(ttk.Frame):
             self.grade_tree.column(c, width=140, anchor=tk.W)
         self.grade_tree.column("id", width=50)
         self.grade_tree.pack(fill=tk.BOTH, expand=True)
+        self.grade_view = SortFilterTree(self.grade_tree, right, types={"id": _int_key})
 
         controls = ttk.Frame(right)
         controls.pack(pady=6)
@@ -523,17 +1439,14 @@ class TeacherDashboard(ttk.Frame):
 
     def refresh_grade_students(self):
         roll = self.g_roll.get()
-        for r in self.grade_tree.get_children():
-            self.grade_tree.delete(r)
+        self.grade_view.set_rows([])
         if not roll:
             return
         s = self.app.db.get_student_by_roll(roll)
         if not s:
             messagebox.showerror("Not Found", "Student not found.")
             return
-        sid = s[0]
-        for row in self.app.db.list_grades(sid):
-            self.grade_tree.insert('', tk.END, values=row)
+        self.grade_view.set_rows(g.values() for g in self.app.db.list_grades(s.id))
 
     def add_grade(self):
         try:
@@ -543,7 +1456,7 @@ class TeacherDashboard(ttk.Frame):
             s = self.app.db.get_student_by_roll(roll)
             if not s:
                 raise ValueError("Student not found.")
-            self.app.db.add_grade(s[0], subject, term, grade)
+            self.app.db.add_grade(s.id, subject, term, grade)
             self.refresh_grade_students()
             self.g_subject.set(""); self.g_term.set(""); self.g_grade.set("")
             messagebox.showinfo("Success", "Grade added.")
@@ -582,6 +1495,12 @@ class TeacherDashboard(ttk.Frame):
             w.pack(fill=tk.X, pady=4)
         ttk.Button(left, text="Add Attendance", command=self.add_attendance).pack(pady=6)
 
+        ttk.Label(left, text="Department Roll-call", font=("Segoe UI", 12, 'bold')).pack(pady=(12,8))
+        self.a_dept = LabeledEntry(left, "Department:")
+        self.a_dept.pack(fill=tk.X, pady=4)
+        self.a_dept_btn = ttk.Button(left, text="Mark Department", command=self.add_department_attendance)
+        self.a_dept_btn.pack(pady=6)
+
         cols = ("id","date","subject","status")
         self.att_tree = ttk.Treeview(right, columns=cols, show='headings', selectmode='browse')
         for c in cols:
@@ -589,6 +1508,7 @@ class TeacherDashboard(ttk.Frame):
             self.att_tree.column(c, width=140, anchor=tk.W)
         self.att_tree.column("id", width=50)
         self.att_tree.pack(fill=tk.BOTH, expand=True)
+        self.att_view = SortFilterTree(self.att_tree, right, types={"id": _int_key})
 
         controls = ttk.Frame(right)
         controls.pack(pady=6)
@@ -597,17 +1517,14 @@ class TeacherDashboard(ttk.Frame):
 
     def refresh_att_students(self):
         roll = self.a_roll.get()
-        for r in self.att_tree.get_children():
-            self.att_tree.delete(r)
+        self.att_view.set_rows([])
         if not roll:
             return
         s = self.app.db.get_student_by_roll(roll)
         if not s:
             messagebox.showerror("Not Found", "Student not found.")
             return
-        sid = s[0]
-        for row in self.app.db.list_attendance(sid):
-            self.att_tree.insert('', tk.END, values=row)
+        self.att_view.set_rows(a.values() for a in self.app.db.list_attendance(s.id))
 
     def add_attendance(self):
         try:
@@ -615,17 +1532,58 @@ class TeacherDashboard(ttk.Frame):
             if not all([roll, date, subject, status]):
                 raise ValueError("All fields are required.")
             # date validation
-            datetime.strptime(date, "%Y-%m-%d")
+            datetime.strptime(date, DATE_FORMAT)
             s = self.app.db.get_student_by_roll(roll)
             if not s:
                 raise ValueError("Student not found.")
-            self.app.db.add_attendance(s[0], date, subject, status)
+            raised = self.app.db.add_attendance(s.id, date, subject, status)
             self.refresh_att_students()
             self.a_subject.set("")
-            messagebox.showinfo("Success", "Attendance added.")
+            if raised:
+                self.app.notify()
+                messagebox.showwarning("Success", "Attendance added. Low-attendance alert raised.")
+            else:
+                messagebox.showinfo("Success", "Attendance added.")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def add_department_attendance(self):
+        try:
+            dept = self.a_dept.get(); date = self.a_date.get(); subject = self.a_subject.get(); status = self.a_status.get()
+            if not all([dept, date, subject, status]):
+                raise ValueError("Department, Date and Subject are required.")
+            datetime.strptime(date, DATE_FORMAT)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        # Run the bulk write off the Tk thread and poll for its result
+        result = {}
+
+        def work():
+            try:
+                result['value'] = self.app.db.add_department_attendance(dept, date, subject, status)
+            except Exception as e:
+                result['error'] = e
+
+        worker = threading.Thread(target=work, daemon=True)
+        self.a_dept_btn.config(state=tk.DISABLED)
+        worker.start()
+        self.after(100, self._poll_department_attendance, worker, result)
+
+    def _poll_department_attendance(self, worker, result):
+        if worker.is_alive():
+            self.after(100, self._poll_department_attendance, worker, result)
+            return
+        self.a_dept_btn.config(state=tk.NORMAL)
+        if 'error' in result:
+            messagebox.showerror("Error", str(result['error']))
+            return
+        count, raised = result['value']
+        if raised:
+            self.app.notify()
+        self.refresh_att_students()
+        messagebox.showinfo("Success", f"Attendance marked for {count} student(s). {raised} low-attendance alert(s) raised.")
+
     def delete_attendance(self):
         sel = self.att_tree.selection()
         if not sel:
@@ -636,6 +1594,23 @@ class TeacherDashboard(ttk.Frame):
             self.app.db.delete_attendance(aid)
             self.refresh_att_students()
 
+    # ---- Alerts Tab ---- #
+    def _build_alerts_tab(self):
+        ttk.Label(self.tab_alerts, text="Open Low-attendance Alerts", font=("Segoe UI", 12, 'bold')).pack(anchor='w', pady=(0,8))
+        cols = ("roll","name","subject","attendance","raised")
+        self.alert_tree = ttk.Treeview(self.tab_alerts, columns=cols, show='headings', selectmode='browse')
+        for c in cols:
+            self.alert_tree.heading(c, text=c.capitalize())
+            self.alert_tree.column(c, width=140, anchor=tk.W)
+        self.alert_tree.pack(fill=tk.BOTH, expand=True)
+        self.alert_view = SortFilterTree(self.alert_tree, self.tab_alerts, types={"attendance": lambda v: float(v.rstrip('%'))})
+        ttk.Button(self.tab_alerts, text="Refresh", command=self.refresh_alerts).pack(pady=6)
+        # Alerts change with every attendance write, so reload whenever the tab is opened
+        self.nb.bind('<<NotebookTabChanged>>', lambda e: self.refresh_alerts() if self.nb.select() == str(self.tab_alerts) else None)
+
+    def refresh_alerts(self):
+        self.alert_view.set_rows(a.values() for a in self.app.db.list_alerts())
+
 class StudentDashboard(ttk.Frame):
     def __init__(self, parent, app: App):
         super().__init__(parent, padding=8)
@@ -670,6 +1645,7 @@ class StudentDashboard(ttk.Frame):
             self.s_grade_tree.heading(c, text=c.capitalize())
             self.s_grade_tree.column(c, width=160, anchor=tk.W)
         self.s_grade_tree.pack(fill=tk.BOTH, expand=True)
+        self.s_grade_view = SortFilterTree(self.s_grade_tree, self.tab_grades)
 
         # Attendance table
         acols = ("date","subject","status")
@@ -678,6 +1654,7 @@ class StudentDashboard(ttk.Frame):
             self.s_att_tree.heading(c, text=c.capitalize())
             self.s_att_tree.column(c, width=160, anchor=tk.W)
         self.s_att_tree.pack(fill=tk.BOTH, expand=True)
+        self.s_att_view = SortFilterTree(self.s_att_tree, self.tab_att)
 
     def on_show(self, student_id, student_name):
         self.student_id = student_id
@@ -688,20 +1665,15 @@ class StudentDashboard(ttk.Frame):
         self.load_attendance()
 
     def load_profile(self):
-        con = self.app.db._connect()
-        cur = con.cursor()
-        cur.execute("SELECT roll, name, dob, department, email, phone FROM students WHERE id=?", (self.student_id,))
-        row = cur.fetchone()
-        con.close()
-        if row:
-            roll, name, dob, dept, email, phone = row
+        st = self.app.db.get_student(self.student_id)
+        if st:
             info = [
-                f"Roll: {roll}",
-                f"Name: {name}",
-                f"DOB: {dob}",
-                f"Department: {dept}",
-                f"Email: {email}",
-                f"Phone: {phone}",
+                f"Roll: {st.roll}",
+                f"Name: {st.name}",
+                f"DOB: {st.dob_iso}",
+                f"Department: {st.department}",
+                f"Email: {st.email}",
+                f"Phone: {st.phone}",
             ]
             self.profile_text.config(state=tk.NORMAL)
             self.profile_text.delete('1.0', tk.END)
@@ -709,16 +1681,12 @@ class StudentDashboard(ttk.Frame):
             self.profile_text.config(state=tk.DISABLED)
 
     def load_grades(self):
-        for r in self.s_grade_tree.get_children():
-            self.s_grade_tree.delete(r)
-        for _id, subject, term, grade in self.app.db.list_grades(self.student_id):
-            self.s_grade_tree.insert('', tk.END, values=(subject, term, grade))
+        rows = self.app.db.list_grades(self.student_id)
+        self.s_grade_view.set_rows((g.subject, g.term, g.grade) for g in rows)
 
     def load_attendance(self):
-        for r in self.s_att_tree.get_children():
-            self.s_att_tree.delete(r)
-        for _id, date, subject, status in self.app.db.list_attendance(self.student_id):
-            self.s_att_tree.insert('', tk.END, values=(date, subject, status))
+        rows = self.app.db.list_attendance(self.student_id)
+        self.s_att_view.set_rows((a.date_iso, a.subject, a.status) for a in rows)
 
 
 if __name__ == '__main__':
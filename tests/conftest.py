@@ -0,0 +1,45 @@
+import importlib.util
+import smtplib
+from pathlib import Path
+
+import pytest
+
+APP_PATH = Path(__file__).resolve().parent.parent / "gui sms.py"
+
+
+@pytest.fixture(scope="session")
+def sms():
+    spec = importlib.util.spec_from_file_location("gui_sms", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def db(sms, tmp_path):
+    return sms.Database(str(tmp_path / "test.db"))
+
+
+class LocalSMTP:
+    """In-process stand-in for smtplib.SMTP; delivered messages go to `sent`."""
+
+    def __init__(self, sent=None):
+        self.sent = [] if sent is None else sent
+        self.closed = False
+
+    def send_message(self, msg):
+        if self.closed:
+            raise smtplib.SMTPServerDisconnected("connection closed")
+        self.sent.append(msg)
+        return {}
+
+    def noop(self):
+        return (250, b"OK")
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def local_smtp():
+    return LocalSMTP
@@ -0,0 +1,174 @@
+import errno
+import smtplib
+import socket
+import sqlite3
+
+import pytest
+
+
+def add_student(db, roll="R1", email="asha@example.edu"):
+    db.add_student(roll, "Asha Rao", "2001-01-05", "CSE", email, "")
+    return db.get_student_by_roll(roll).id
+
+
+def mark(db, sid, statuses, subject="Math", start=1):
+    raised = 0
+    for day, status in enumerate(statuses, start):
+        raised += db.add_attendance(sid, f"2024-01-{day:02d}", subject, status)
+    return raised
+
+
+def outbox_rows(db):
+    con = sqlite3.connect(db.db_path)
+    rows = con.execute("SELECT recipient, attempts, sent_at FROM outbox ORDER BY id").fetchall()
+    con.close()
+    return rows
+
+
+def test_alert_raised_once_per_drop(db):
+    sid = add_student(db)
+    # Not judged before ALERT_MIN_SESSIONS
+    assert mark(db, sid, ["Absent"] * 4) == 0
+    assert mark(db, sid, ["Absent"], start=5) == 1
+    assert mark(db, sid, ["Absent"] * 3, start=6) == 0
+    assert [a.subject for a in db.list_alerts()] == ["Math"]
+    assert len(outbox_rows(db)) == 1
+
+
+def test_alert_clears_on_recovery_and_fires_again(db):
+    sid = add_student(db)
+    assert mark(db, sid, ["Absent"] * 5) == 1
+    mark(db, sid, ["Present"] * 15, start=6)  # 15/20 = 75%
+    assert db.list_alerts() == []
+    assert mark(db, sid, ["Absent"], start=21) == 1
+    assert len(outbox_rows(db)) == 2
+
+
+def test_bulk_roll_call_and_no_email_without_address(db):
+    ids = [add_student(db, f"R{i}", email="" if i % 2 else f"s{i}@example.edu") for i in range(10)]
+    for day in range(1, 6):
+        db.add_department_attendance("CSE", f"2024-02-{day:02d}", "Physics", "Absent")
+    assert len(db.list_alerts()) == len(ids)
+    assert len(outbox_rows(db)) == 5
+
+
+def test_backfill_evaluates_existing_attendance(sms, db):
+    sid = add_student(db)
+    con = sqlite3.connect(db.db_path)
+    con.executemany(
+        "INSERT INTO attendance(student_id, date, subject, status) VALUES (?,?,?,?)",
+        [(sid, f"2024-01-{d:02d}", "Math", "Absent") for d in range(1, 7)],
+    )
+    con.execute("DELETE FROM attendance_stats")
+    con.commit()
+    con.close()
+    reopened = sms.Database(db.db_path)
+    assert [a.subject for a in reopened.list_alerts()] == ["Math"]
+    assert len(outbox_rows(reopened)) == 1
+
+
+def queue_messages(db, count):
+    for i in range(count):
+        sid = add_student(db, f"R{i}", email=f"s{i}@example.edu")
+        mark(db, sid, ["Absent"] * 5)
+
+
+def test_drain_sends_in_batches_over_one_connection(sms, db, local_smtp):
+    queue_messages(db, 7)
+    sent, connections = [], []
+
+    def factory():
+        connections.append(local_smtp(sent))
+        return connections[-1]
+
+    worker = sms.NotificationWorker(db, smtp_factory=factory, batch_size=3, rate=0)
+    assert [worker.drain() for _ in range(4)] == [3, 3, 1, 0]
+    assert len(sent) == 7 and len(connections) == 1
+    assert all(sent_at for _r, _a, sent_at in outbox_rows(db))
+
+
+def test_drain_reconnects_after_disconnect(sms, db, local_smtp):
+    queue_messages(db, 4)
+    sent, connections = [], []
+
+    def factory():
+        connections.append(local_smtp(sent))
+        return connections[-1]
+
+    worker = sms.NotificationWorker(db, smtp_factory=factory, batch_size=2, rate=0)
+    assert worker.drain() == 2
+    connections[0].quit()  # server drops the pooled connection
+    assert worker.drain() == 2
+    assert len(sent) == 4 and len(connections) == 2
+
+
+def test_bad_message_does_not_block_outbox(sms, db, local_smtp):
+    queue_messages(db, 2)
+    sent = []
+
+    class PickySMTP(local_smtp):
+        def send_message(self, msg):
+            if msg["To"] == "s0@example.edu":
+                raise smtplib.SMTPNotSupportedError("SMTPUTF8 not supported")
+            return super().send_message(msg)
+
+    worker = sms.NotificationWorker(db, smtp_factory=lambda: PickySMTP(sent), rate=0)
+    assert worker.drain() == 2
+    assert [m["To"] for m in sent] == ["s1@example.edu"]
+    (bad_to, bad_attempts, bad_sent), (_to, _attempts, good_sent) = outbox_rows(db)
+    assert bad_attempts == 1 and bad_sent is None and good_sent
+    # Deferred by the retry backoff rather than re-fetched straight away
+    assert db.fetch_outbox() == []
+    assert worker.drain() == 0
+
+
+@pytest.mark.parametrize("error", [
+    ConnectionRefusedError("no server"),
+    socket.gaierror(socket.EAI_NONAME, "Name or service not known"),
+    OSError(errno.ENETUNREACH, "Network is unreachable"),
+    smtplib.SMTPAuthenticationError(535, b"bad credentials"),
+])
+def test_connection_failure_leaves_outbox_pending(sms, db, error):
+    queue_messages(db, 3)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        raise error
+
+    worker = sms.NotificationWorker(db, smtp_factory=factory, rate=0)
+    for _ in range(6):
+        with pytest.raises(type(error)):
+            worker.drain()
+    assert len(calls) == 6  # opened once per batch, not once per message
+    assert [(a, s) for _r, a, s in outbox_rows(db)] == [(0, None)] * 3
+    assert len(db.fetch_outbox()) == 3
+
+
+def test_failed_reconnect_mid_batch_aborts(sms, db, local_smtp):
+    queue_messages(db, 3)
+    connections = []
+
+    def factory():
+        if connections:
+            raise socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+        connections.append(local_smtp())
+        connections[0].quit()  # first send finds the connection dropped
+        return connections[0]
+
+    worker = sms.NotificationWorker(db, smtp_factory=factory, rate=0)
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        worker.drain()
+    assert [(a, s) for _r, a, s in outbox_rows(db)] == [(0, None)] * 3
+
+
+def test_rejected_message_is_retried_after_backoff(sms, db):
+    queue_messages(db, 1)
+    (msg_id, *_), = db.fetch_outbox()
+    db.mark_outbox_failed(msg_id, "550 mailbox unavailable")
+    assert db.fetch_outbox() == []
+    con = sqlite3.connect(db.db_path)
+    con.execute("UPDATE outbox SET next_attempt_at='2000-01-01T00:00:00'")
+    con.commit()
+    con.close()
+    assert [r[0] for r in db.fetch_outbox()] == [msg_id]
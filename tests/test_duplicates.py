@@ -0,0 +1,48 @@
+import sqlite3
+
+
+def test_trigrams_ignore_case_accents_punctuation_and_word_order(sms):
+    assert sms.name_trigrams("José  Álvarez") == sms.name_trigrams("alvarez, JOSE")
+
+
+def test_dob_formatting_does_not_split_blocks(db):
+    db.add_student("R1", "Asha Rao", "2001-01-05", "CSE", "", "")
+    (match, score), = db.find_duplicates("Asha  Rao", "2001-1-5")
+    assert match.roll == "R1" and score == 1.0
+
+    db.add_student("R2", "Asha Raoo", "2001-1-5", "CSE", "", "")
+    assert db.get_student_by_roll("R2").dob_iso == "2001-01-05"
+    (a, b, _score), = db.find_all_duplicates()
+    assert {a.roll, b.roll} == {"R1", "R2"}
+
+
+def test_index_follows_update_and_delete(db):
+    db.add_student("R1", "Asha Rao", "2001-01-05", "CSE", "", "")
+    db.add_student("R2", "Asha Rao", "2001-01-05", "CSE", "", "")
+    r2 = db.get_student_by_roll("R2").id
+    db.update_student(r2, "R2", "Vikram Singh", "2001-01-05", "CSE", "", "")
+    assert db.find_all_duplicates() == []
+    assert [st.roll for st, _ in db.find_duplicates("Asha Rao", "2001-01-05")] == ["R1"]
+    db.delete_student(db.get_student_by_roll("R1").id)
+    assert db.find_duplicates("Asha Rao", "2001-01-05") == []
+
+
+def test_legacy_unpadded_dob_is_migrated(sms, db):
+    con = sqlite3.connect(db.db_path)
+    con.execute("INSERT INTO students(roll, name, dob) VALUES ('R9', 'Legacy Row', '2001-1-5')")
+    con.commit()
+    con.close()
+    reopened = sms.Database(db.db_path)
+    assert reopened.student_auth("R9", "2001-1-5") is not None
+    assert reopened.student_auth("R9", "2001-01-05") is not None
+
+
+def test_exclude_id_skips_the_student_being_edited(db):
+    db.add_student("R1", "Asha Rao", "2001-01-05", "CSE", "", "")
+    db.add_student("R2", "Vikram Singh", "2001-01-05", "CSE", "", "")
+    r1 = db.get_student_by_roll("R1").id
+    r2 = db.get_student_by_roll("R2").id
+    # Saving R1 unchanged is not a duplicate of itself...
+    assert db.find_duplicates("Asha Rao", "2001-01-05", exclude_id=r1) == []
+    # ...but renaming R2 to match R1 is
+    assert [st.roll for st, _ in db.find_duplicates("Asha Rao", "2001-1-5", exclude_id=r2)] == ["R1"]
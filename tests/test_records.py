@@ -0,0 +1,35 @@
+def test_unpadded_dates_survive_round_trip(db):
+    db.add_student("R1", "Asha Rao", "2001-1-5", "CSE", "", "")
+    st = db.get_student_by_roll("R1")
+    assert st.dob_iso == "2001-01-05"
+    assert db.list_students()[0].values()[3] == "2001-01-05"
+
+    db.add_attendance(st.id, "2024-3-7", "Math", "Present")
+    (rec,) = db.list_attendance(st.id)
+    assert rec.date_iso == "2024-03-07"
+    assert isinstance(rec.date, int)
+
+
+def test_unparseable_stored_date_is_kept(sms, db):
+    import sqlite3
+    con = sqlite3.connect(db.db_path)
+    con.execute("INSERT INTO students(roll, name, dob) VALUES ('R9', 'Legacy Row', '05/01/2001')")
+    con.commit()
+    con.close()
+    assert db.get_student_by_roll("R9").dob_iso == "05/01/2001"
+
+
+def test_iterators_stream_all_rows(sms, db):
+    for i in range(25):
+        db.add_student(f"R{i:02d}", f"Student {i}", "2000-01-01", "ECE", "", "")
+    sid = db.get_student_by_roll("R00").id
+    db.add_attendance_bulk((sid, f"2024-01-{d:02d}", "Math", "Present") for d in range(1, 11))
+    assert [s.roll for s in db.iter_students(batch_size=4)] == [s.roll for s in db.list_students()]
+    assert len(list(db.iter_attendance(batch_size=3))) == 10
+    assert all(isinstance(r, sms.AttendanceRecord) for r in db.iter_attendance(sid))
+
+
+def test_profile_lookup_returns_record(db):
+    db.add_student("R1", "Asha Rao", "2001-01-05", "CSE", "a@x.edu", "99")
+    st = db.get_student(db.get_student_by_roll("R1").id)
+    assert (st.name, st.email, st.phone) == ("Asha Rao", "a@x.edu", "99")
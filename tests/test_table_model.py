@@ -0,0 +1,94 @@
+import pytest
+
+COLS = ("id", "roll", "name")
+ROWS = [(10, "R3", "asha"), (9, "R1", "Bala"), (100, "R2", "chitra"), (2, "R4", "Asif")]
+
+
+@pytest.fixture
+def model(sms):
+    m = sms.TableModel(COLS, {"id": sms._int_key})
+    m.set_rows(ROWS)
+    return m
+
+
+def ids(model):
+    return [model.rows[i][0] for i in model.visible()]
+
+
+def test_unsorted_keeps_load_order(model):
+    assert ids(model) == [10, 9, 100, 2]
+
+
+def test_int_key_sorts_numerically(model):
+    model.sort("id")
+    assert ids(model) == [2, 9, 10, 100]
+
+
+def test_text_sort_is_case_insensitive(model):
+    model.sort("name")
+    assert [model.rows[i][2] for i in model.visible()] == ["asha", "Asif", "Bala", "chitra"]
+
+
+def test_toggle_sort_reverses_then_resets_on_new_column(model):
+    model.toggle_sort("id")
+    assert (model.sort_col, model.descending) == ("id", False)
+    model.toggle_sort("id")
+    assert model.descending and ids(model) == [100, 10, 9, 2]
+    model.toggle_sort("roll")
+    assert (model.sort_col, model.descending) == ("roll", False)
+    assert ids(model) == [9, 100, 10, 2]
+
+
+def test_int_key_tolerates_blank_values(sms):
+    m = sms.TableModel(("id",), {"id": sms._int_key})
+    m.set_rows([("7",), ("",), (None,), (3,)])
+    m.sort("id")
+    assert [m.rows[i][0] for i in m.visible()][-2:] == [3, "7"]
+
+
+def test_filters_combine_and_ignore_case(model):
+    model.set_filter("name", "AS")
+    assert ids(model) == [10, 2]
+    model.set_filter("roll", "r4")
+    assert ids(model) == [2]
+    model.set_filter("roll", "  ")  # blank clears that column's filter
+    assert ids(model) == [10, 2]
+
+
+def test_filter_respects_sort_order(model):
+    model.sort("id", descending=True)
+    model.set_filter("name", "a")
+    assert ids(model) == [100, 10, 9, 2]
+
+
+def test_set_rows_keeps_sort_and_filters(model):
+    model.sort("id", descending=True)
+    model.set_filter("name", "a")
+    model.set_rows([(1, "R9", "Zara"), (5, "R8", "Om"), (3, "R7", "Tara")])
+    assert (model.sort_col, model.descending) == ("id", True)
+    assert ids(model) == [3, 1]
+
+
+def test_sort_filter_tree_set_rows_keeps_view_state(sms):
+    tk = pytest.importorskip("tkinter")
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    try:
+        from tkinter import ttk
+        tree = ttk.Treeview(root, columns=COLS, show="headings")
+        for c in COLS:
+            tree.heading(c, text=c.capitalize())
+        tree.pack()
+        view = sms.SortFilterTree(tree, root, types={"id": sms._int_key})
+        view.set_rows(ROWS)
+        view.on_heading("id")
+        view.filter_vars["name"].set("a")
+        view._apply_filters()
+        assert [tree.item(i, "values")[0] for i in tree.get_children()] == ["9", "10", "100"]
+        view.set_rows([(1, "R9", "Zara"), (5, "R8", "Om"), (3, "R7", "Tara")])
+        assert [tree.item(i, "values")[0] for i in tree.get_children()] == ["1", "3"]
+        assert tree.heading("id", "text").startswith("Id ")
+    finally:
+        root.destroy()